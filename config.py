@@ -32,5 +32,6 @@ OUTPUT_FPS = 88            # Output rate (2x DMX for smooth operation)
 # ============================================================================
 # PERFORMANCE SETTINGS
 # ============================================================================
-FRAME_BUFFER_SIZE = 50     # Frame buffer size (increase if dropping frames)
 PERFORMANCE_MONITORING = True  # Show performance statistics
+KEEPALIVE_INTERVAL = 0.2   # Resend unchanged frames at least this often (seconds)
+RECEIVER_PROCESS = False   # Receive sACN/ArtNet in a separate process (Python 3.8+)
@@ -8,9 +8,15 @@ to physical DMX512 output via Arduino.
 import sacn
 import serial
 import serial.tools.list_ports
+import ctypes
+import multiprocessing
+import os
+import signal
+import struct
+import sys
 import time
 import threading
-import queue
+from collections import deque, namedtuple
 import config
 
 try:
@@ -19,31 +25,132 @@ try:
 except ImportError:
     ARTNET_AVAILABLE = False
 
+try:
+    from multiprocessing import shared_memory
+    SHARED_MEMORY_AVAILABLE = True
+except ImportError:  # Python < 3.8
+    SHARED_MEMORY_AVAILABLE = False
+
+# Output timing: sleep until this close to the deadline, then spin
+SPIN_THRESHOLD = 0.002
+
+# Hot-path log messages are printed by a background thread at this interval
+LOG_FLUSH_INTERVAL = 0.25
+
+# How long a receiver process may take to start listening (seconds)
+RECEIVER_START_TIMEOUT = 10.0
+
+# Everything a status display needs, gathered by DMXBridge.get_snapshot()
+Snapshot = namedtuple('Snapshot', ['fps', 'active', 'max_val', 'processed', 'dropped', 'drop_rate'])
+
+
+def _receiver_process(shm_name, protocol, universe, channels, ready_event, stop_event):
+    """Receiver process entry point (RECEIVER_PROCESS mode)
+    
+    Writes every received frame into shared memory: byte 0 is a sequence
+    number that is odd while a frame is being written, bytes 1.. hold the
+    latest frame. Sets ready_event once listening; exits with code 1 if
+    the receiver can't be started.
+    """
+    # Ctrl+C goes to the whole process group; the parent decides when to stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buf = shm.buf
+
+    def publish(data):
+        data = bytes(data)
+        if len(data) != channels:
+            data = data[:channels].ljust(channels, b'\x00')
+        buf[0] = (buf[0] + 1) & 0xFF
+        buf[1:] = data
+        buf[0] = (buf[0] + 1) & 0xFF
+
+    try:
+        if protocol == "sacn":
+            receiver = sacn.sACNreceiver()
+            receiver.start()
+            receiver.register_listener('universe', lambda packet: publish(packet.dmxData), universe=universe)
+            receiver.join_multicast(universe)
+        else:
+            receiver = StupidArtnetServer()
+            receiver.register_listener(universe=universe, callback_function=publish)
+    except Exception as e:
+        print(f"✗ {'sACN' if protocol == 'sacn' else 'ArtNet'} error: {e}")
+        sys.exit(1)
+    ready_event.set()
+
+    stop_event.wait()
+    if protocol == "sacn":
+        receiver.stop()
+    # The ArtNet server thread is a daemon and ends with the process
+
 
 class DMXBridge:
     def __init__(self):
         self.ser = None
+        self._fd = None            # Raw serial file descriptor (POSIX only)
+        self._connected = False    # Port open; tracked here instead of querying pyserial
+        self._tx_pending = b''     # Unsent tail of a partially written frame
+        self._last_sent = None     # Copy of the last payload written to the Arduino
+        self._last_sent_time = 0
+        self._tx_inflight = None   # Frame handed to pyserial, kept alive while it is sent
         self.receiver = None
         self.artnet_server = None
+        self.receiver_process = None
+        self._receiver_stop = None
+        self._shm = None
+        self._shm_seq = 0
+        self._shm_source = None
         self.protocol = config.PROTOCOL.lower()
         self.running = False
         
         # High-performance frame processing
-        self.frame_queue = queue.Queue(maxsize=config.FRAME_BUFFER_SIZE)  # Buffer for frames
+        self._latest_frame = None  # Most recent received frame (single-slot hand-off)
+        self._sent_frame = None    # Last slot frame picked up by the output thread
         self.output_thread = None
+        self._timer_period_set = False
+        self._log_q = deque(maxlen=256)  # Messages from receiver/output threads
+        self._log_thread = None
+        self._update_event = threading.Event()  # Wakes wait_for_update() callers
         self.last_frame_time = 0
         self.frame_count = 0
-        self.fps_counter = 0
+        self.fps_counter = 0       # Output ticks, the rate get_fps() reports
+        self.frames_written = 0    # Ticks that wrote a frame (unchanged ones are skipped)
         self.fps_start_time = time.perf_counter()
         
+        # Config values cached for the hot paths (no module attribute lookups per frame)
+        self._channels = config.DMX_CHANNELS
+        self._target_interval_ns = 1_000_000_000 // config.OUTPUT_FPS
+        self._keepalive = config.KEEPALIVE_INTERVAL
+        self._perf_mon = config.PERFORMANCE_MONITORING
+        
         # DMX data management
-        self.dmx_data = [0] * config.DMX_CHANNELS
+        self.dmx_data = bytearray(config.DMX_CHANNELS)
+        # Blackout reference for the activity check: `data != zero_frame` is a memcmp,
+        # unlike any(data) which walks a dark frame one byte object at a time
+        self._zero_frame = bytes(config.DMX_CHANNELS)
+        # Channel stats cache, recomputed only when dmx_data differs from this frame
+        self._stats_frame = self._zero_frame
+        self._channel_stats = (0, 0)
+        self._test_patterns = {
+            'all_off': self._zero_frame,
+            'all_on': b'\xff' * self._channels,
+            'first_5': (b'\xff' * 5 + self._zero_frame)[:self._channels],
+            'dim': b'\x80' * self._channels,
+        }
         self.active = False
         self.last_active_state = False
         
+        # Serial frame is [0xFF, len_lo, len_hi, payload...]; header is constant
+        self._header = struct.pack('<BH', 0xFF, config.DMX_CHANNELS)
+        self._frame_size = len(self._header) + config.DMX_CHANNELS
+        
         # Performance monitoring
         self.dropped_frames = 0
         self.processed_frames = 0
+        self.tx_overrun = 0        # Output ticks skipped because the serial link was busy
+        self._drop_warned = False
         self.fps = 0
         
     def connect(self):
@@ -54,13 +161,18 @@ class DMXBridge:
                 config.ARDUINO_PORT, 
                 config.ARDUINO_BAUD, 
                 timeout=1,
-                write_timeout=0.1  # Prevent blocking on write
+                write_timeout=0  # Non-blocking writes, never stall the output thread
             )
             print(f"  Port opened successfully")
+            
+            # On POSIX write straight to the fd, bypassing pyserial's per-call overhead
+            if os.name == 'posix':
+                self._fd = self.ser.fileno()
             print(f"  Note: Shield TX→D4 (TX-IO), RX→D3 (RX-IO), D2=HIGH (TX mode)")
             print(f"        USB Serial is dedicated to PC link; DMX driven via D4")
             time.sleep(0.5)
             
+            self._connected = True
             print(f"✓ Arduino connected on {config.ARDUINO_PORT}")
             return True
         except serial.SerialException as e:
@@ -79,9 +191,15 @@ class DMXBridge:
         for port in serial.tools.list_ports.comports():
             print(f"  {port.device}: {port.description}")
     
+    def is_connected(self):
+        """Check whether the Arduino serial port is open"""
+        return self._connected
+    
     def start_protocol(self):
         """Start protocol receiver and output thread"""
         try:
+            if config.RECEIVER_PROCESS and self.protocol in ("sacn", "artnet"):
+                return self._start_receiver_process()
             if self.protocol == "sacn":
                 return self._start_sacn()
             elif self.protocol == "artnet":
@@ -103,12 +221,7 @@ class DMXBridge:
             self.receiver.join_multicast(config.SACN_UNIVERSE)
             print(f"✓ sACN listening on universe {config.SACN_UNIVERSE}")
 
-            # Start high-performance output thread
-            self.running = True
-            self.output_thread = threading.Thread(target=self._output_worker, daemon=True)
-            self.output_thread.start()
-            print(f"✓ Output thread started at {config.OUTPUT_FPS} FPS")
-
+            self._start_output_thread()
             return True
         except Exception as e:
             print(f"✗ sACN error: {e}")
@@ -134,12 +247,7 @@ class DMXBridge:
             
             print(f"✓ ArtNet listening on universe {config.ARTNET_UNIVERSE}")
 
-            # Start high-performance output thread
-            self.running = True
-            self.output_thread = threading.Thread(target=self._output_worker, daemon=True)
-            self.output_thread.start()
-            print(f"✓ Output thread started at {config.OUTPUT_FPS} FPS")
-
+            self._start_output_thread()
             return True
         except Exception as e:
             print(f"✗ ArtNet error: {e}")
@@ -147,105 +255,200 @@ class DMXBridge:
             traceback.print_exc()
             return False
     
-    def _on_dmx(self, packet):
-        """Handle DMX packet - optimized for high performance"""
+    def _start_receiver_process(self):
+        """Start sACN/ArtNet receiver in a separate process
+        
+        Packet parsing then no longer competes with the output thread for
+        the GIL; frames are handed over through shared memory.
+        """
         try:
-            # Get DMX data and pad/truncate to expected length
-            data = list(packet.dmxData)
-            if len(data) < config.DMX_CHANNELS:
-                data.extend([0] * (config.DMX_CHANNELS - len(data)))
-            elif len(data) > config.DMX_CHANNELS:
-                data = data[:config.DMX_CHANNELS]
-
-            # Update internal data
-            self.dmx_data = data
-
-            # Check activity state
-            has_data = any(v > 0 for v in data)
-            if has_data != self.last_active_state:
-                self.active = has_data
-                self.last_active_state = has_data
-                print(f"DMX {'ACTIVE' if has_data else 'INACTIVE'}")
-
-            # Add to processing queue (non-blocking)
+            if not SHARED_MEMORY_AVAILABLE:
+                print("✗ RECEIVER_PROCESS requires Python 3.8+")
+                return False
+            if self.protocol == "artnet" and not ARTNET_AVAILABLE:
+                print("✗ stupidArtnet library not installed")
+                print("  Install with: pip install stupidArtnet")
+                return False
+
+            if self.protocol == "sacn":
+                universe, name, self._shm_source = config.SACN_UNIVERSE, "sACN", "DMX"
+            else:
+                universe, name, self._shm_source = config.ARTNET_UNIVERSE, "ArtNet", "ArtNet DMX"
+
+            self._shm = shared_memory.SharedMemory(create=True, size=1 + self._channels)
+            self._shm.buf[0] = 0
+            self._shm_seq = 0
+            ready = multiprocessing.Event()
+            self._receiver_stop = multiprocessing.Event()
+            self.receiver_process = multiprocessing.Process(
+                target=_receiver_process,
+                args=(self._shm.name, self.protocol, universe, self._channels, ready, self._receiver_stop),
+                daemon=True
+            )
+            self.receiver_process.start()
+
+            # Wait for the child to report it is listening, or to exit on error
+            deadline = time.monotonic() + RECEIVER_START_TIMEOUT
+            while not ready.wait(0.05):
+                if not self.receiver_process.is_alive() or time.monotonic() > deadline:
+                    print(f"✗ {name} receiver process failed to start")
+                    self._stop_receiver_process()
+                    return False
+            print(f"✓ {name} listening on universe {universe} (receiver process)")
+
+            self._start_output_thread()
+            return True
+        except Exception as e:
+            print(f"✗ Receiver process error: {e}")
+            self._stop_receiver_process()
+            return False
+
+    def _stop_receiver_process(self):
+        """Stop the receiver process and release shared memory"""
+        if self.receiver_process:
+            self._receiver_stop.set()
+            self.receiver_process.join(timeout=1.0)
+            if self.receiver_process.is_alive():
+                self.receiver_process.terminate()
+            self.receiver_process = None
+        if self._shm is not None:
+            shm, self._shm = self._shm, None
+            shm.close()
+            shm.unlink()
+
+    def _start_output_thread(self):
+        """Start high-performance output thread"""
+        # Windows sleeps in ~15ms steps by default; request 1ms timer resolution
+        if sys.platform == 'win32' and not self._timer_period_set:
             try:
-                self.frame_queue.put_nowait(data)
-                self.processed_frames += 1
-            except queue.Full:
-                self.dropped_frames += 1
-                # Remove oldest frame and add new one
-                try:
-                    self.frame_queue.get_nowait()
-                    self.frame_queue.put_nowait(data)
-                except queue.Empty:
-                    pass
+                ctypes.WinDLL('winmm').timeBeginPeriod(1)
+                self._timer_period_set = True
+            except (AttributeError, OSError):
+                pass
+
+        self.running = True
+        self.output_thread = threading.Thread(target=self._output_worker, daemon=True)
+        self.output_thread.start()
+        self._log_thread = threading.Thread(target=self._log_worker, daemon=True)
+        self._log_thread.start()
+        print(f"✓ Output thread started at {config.OUTPUT_FPS} FPS")
+
+    def _log(self, message):
+        """Queue a message from a hot path; never blocks on stdout"""
+        self._log_q.append(message)
+
+    def _log_worker(self):
+        """Print queued messages off the receiver/output threads"""
+        while self.running:
+            time.sleep(LOG_FLUSH_INTERVAL)
+            self._flush_log()
 
+    def _flush_log(self):
+        """Print and remove all queued messages"""
+        while self._log_q:
+            print(self._log_q.popleft())
+
+    def _on_dmx(self, packet):
+        """Handle DMX packet - optimized for high performance"""
+        try:
+            self._publish_frame(bytes(packet.dmxData), "DMX")
         except Exception as e:
-            print(f"Error processing DMX packet: {e}")
+            self._log(f"Error processing DMX packet: {e}")
 
     def _on_artnet_dmx(self, data):
         """Handle ArtNet DMX packet - optimized for high performance
         
-        stupidArtnet callback receives just the data buffer (bytearray)
+        stupidArtnet callback receives just the data buffer (list of ints)
         """
         try:
-            # Convert to list
-            data = list(data)
-
-            # Pad/truncate to expected length
-            if len(data) < config.DMX_CHANNELS:
-                data.extend([0] * (config.DMX_CHANNELS - len(data)))
-            elif len(data) > config.DMX_CHANNELS:
-                data = data[:config.DMX_CHANNELS]
-
-            # Update internal data
-            self.dmx_data = data
-
-            # Check activity state
-            has_data = any(v > 0 for v in data)
-            if has_data != self.last_active_state:
-                self.active = has_data
-                self.last_active_state = has_data
-                print(f"ArtNet DMX {'ACTIVE' if has_data else 'INACTIVE'}")
-
-            # Add to processing queue (non-blocking)
-            try:
-                self.frame_queue.put_nowait(data)
-                self.processed_frames += 1
-            except queue.Full:
-                self.dropped_frames += 1
-                # Remove oldest frame and add new one
-                try:
-                    self.frame_queue.get_nowait()
-                    self.frame_queue.put_nowait(data)
-                except queue.Empty:
-                    pass
-
+            self._publish_frame(bytes(data), "ArtNet DMX")
         except Exception as e:
-            print(f"Error processing ArtNet DMX packet: {e}")
+            self._log(f"Error processing ArtNet DMX packet: {e}")
+
+    def _publish_frame(self, data, source):
+        """Normalize a received frame and hand it to the output worker"""
+        # Pad/truncate to expected length
+        if len(data) != self._channels:
+            data = data[:self._channels].ljust(self._channels, b'\x00')
+
+        # Update internal data in place
+        self.dmx_data[:] = data
+
+        # Check activity state
+        has_data = data != self._zero_frame
+        if has_data != self.last_active_state:
+            self.active = has_data
+            self.last_active_state = has_data
+            self._log(f"{source} {'ACTIVE' if has_data else 'INACTIVE'}")
+            self._update_event.set()
+
+        # Publish as latest frame (reference assignment is atomic);
+        # a frame still waiting in the slot is superseded and counted as dropped
+        if self._latest_frame is not self._sent_frame:
+            self.dropped_frames += 1
+        else:
+            self.processed_frames += 1
+        self._latest_frame = data
     
     def _output_worker(self):
         """High-performance output thread running at 2x DMX rate"""
-        target_interval = 1.0 / config.OUTPUT_FPS  # 2x DMX rate
-        next_send_time = time.perf_counter()
+        if hasattr(os, 'timerfd_create'):
+            self._output_worker_timerfd()
+        else:
+            self._output_worker_sleep()
+    
+    def _output_worker_timerfd(self):
+        """Output loop paced by a kernel periodic timer (Linux, Python 3.13+)
+        
+        The thread blocks in os.read() without holding the GIL until the timer
+        fires, so pacing never competes with the receiver threads. Falls back
+        to the sleep loop if the kernel refuses the timer (seccomp, sandboxes).
+        """
+        interval_ns = self._target_interval_ns
+        try:
+            timer_fd = os.timerfd_create(time.CLOCK_MONOTONIC)
+        except OSError as e:
+            self._log(f"timerfd unavailable ({e}), using sleep timing")
+            return self._output_worker_sleep()
+        try:
+            os.timerfd_settime_ns(timer_fd, initial=interval_ns, interval=interval_ns)
+        except OSError as e:
+            os.close(timer_fd)
+            self._log(f"timerfd unavailable ({e}), using sleep timing")
+            return self._output_worker_sleep()
+        
+        try:
+            # Bind per-tick callables to locals once
+            read = os.read
+            tick = self._output_tick
+            
+            while self.running:
+                read(timer_fd, 8)  # Expiration count; missed ticks are simply skipped
+                tick()
+        finally:
+            os.close(timer_fd)
+    
+    def _output_worker_sleep(self):
+        """Output loop paced by sleep/spin on perf_counter_ns
+        
+        Deadlines are integer nanoseconds so they never accumulate float error.
+        """
+        target_interval = self._target_interval_ns  # 2x DMX rate
+        
+        # Bind per-iteration callables and constants to locals once
+        perf_counter_ns = time.perf_counter_ns
+        sleep = time.sleep
+        tick = self._output_tick
+        spin_threshold = int(SPIN_THRESHOLD * 1_000_000_000)
+        
+        next_send_time = perf_counter_ns()
         
         while self.running:
-            current_time = time.perf_counter()
+            current_time = perf_counter_ns()
             
             # Check if it's time to send
             if current_time >= next_send_time:
-                try:
-                    # Get latest frame (non-blocking)
-                    frame_data = self.frame_queue.get_nowait()
-                    self._send_frame_to_arduino(frame_data)
-                    self.fps_counter += 1
-                except queue.Empty:
-                    # No new frame, send last known data
-                    if self.dmx_data:
-                        self._send_frame_to_arduino(self.dmx_data)
-                        self.fps_counter += 1
-                except Exception as e:
-                    print(f"Output worker error: {e}")
+                tick()
                 
                 # Calculate next send time for precise timing
                 next_send_time += target_interval
@@ -254,67 +457,148 @@ class DMXBridge:
                 if next_send_time < current_time:
                     next_send_time = current_time + target_interval
             else:
-                # Precise sleep until next send time
+                # Coarse sleep until close to the deadline, then spin for precision
                 sleep_time = next_send_time - current_time
-                if sleep_time > 0.0001:  # Only sleep if > 0.1ms
-                    time.sleep(sleep_time * 0.5)  # Sleep half the remaining time
+                if sleep_time > spin_threshold:
+                    sleep((sleep_time - spin_threshold // 2) * 1e-9)
+                else:
+                    while perf_counter_ns() < next_send_time:
+                        sleep(0)  # Yield the GIL to receiver threads while spinning
     
+    def _output_tick(self):
+        """Send latest frame if it is new, otherwise last known data"""
+        try:
+            if self._shm is not None:
+                self._poll_receiver_process()
+            frame_data = self._latest_frame
+            if frame_data is not self._sent_frame:
+                self._sent_frame = frame_data
+            else:
+                frame_data = self.dmx_data
+            self.fps_counter += 1
+            if self._send_frame_to_arduino(frame_data):
+                self.frames_written += 1
+        except Exception as e:
+            self._log(f"Output worker error: {e}")
+    
+    def _poll_receiver_process(self):
+        """Pick up the receiver process's latest frame from shared memory"""
+        buf = self._shm.buf
+        seq = buf[0]
+        if seq == self._shm_seq or seq & 1:
+            return  # Nothing new, or a frame is being written
+        data = bytes(buf[1:])
+        if buf[0] != seq:
+            return  # Overwritten while copying; pick it up next tick
+
+        # Each frame advances the sequence by 2; any in between were overwritten
+        self.dropped_frames += (((seq - self._shm_seq) & 0xFF) >> 1) - 1
+        self._shm_seq = seq
+        self._publish_frame(data, self._shm_source)
+
     def _send_frame_to_arduino(self, data):
-        """Send optimized frame to Arduino"""
-        if not self.ser or not self.ser.is_open:
-            return
+        """Send optimized frame to Arduino, returns True if it was written
         
+        Unchanged frames are skipped until KEEPALIVE_INTERVAL has passed;
+        DmxSimple keeps refreshing the DMX line from its own buffer, the
+        keepalive just resyncs an Arduino that was reset.
+        """
+        if not self._connected:
+            return False
+        
+        now = time.perf_counter()
         try:
-            # Pre-build packet structure for maximum speed
-            # [0xFF, len_lo, len_hi, data...]
-            packet = bytearray(3 + len(data))
-            packet[0] = 0xFF
-            packet[1] = config.DMX_CHANNELS & 0xFF
-            packet[2] = (config.DMX_CHANNELS >> 8) & 0xFF
-            packet[3:] = data
+            if data == self._last_sent and now - self._last_sent_time < self._keepalive:
+                # Still finish a partly written frame, or the Arduino waits mid-frame
+                if self._tx_pending:
+                    self._flush_pending()
+                return False
+            
+            # At 250000 baud a 515-byte frame spends ~20.6ms on the wire (~48 FPS),
+            # so 88 FPS saturates the link. Allow one frame queued behind the one
+            # being sent and skip the tick otherwise, instead of building latency.
+            if self.ser.out_waiting > self._frame_size:
+                self.tx_overrun += 1
+                return False
+            
+            # Snapshot the payload, dmx_data is mutable (no copy for bytes frames)
+            payload = bytes(data)
             
-            # Write packet (non-blocking)
-            self.ser.write(packet)
+            # Write header + payload (non-blocking)
+            if self._fd is not None:
+                if not self._write_fd(payload):
+                    self.tx_overrun += 1
+                    return False
+            else:
+                # pyserial copies bytearray/memoryview input but passes bytes through;
+                # hold the reference so a pending non-blocking write keeps its buffer
+                self._tx_inflight = self._header + payload
+                self.ser.write(self._tx_inflight)
+            
+            self._last_sent = payload
+            self._last_sent_time = now
+            return True
             
+        except serial.SerialTimeoutException:
+            self.tx_overrun += 1
+            return False
         except Exception as e:
-            print(f"Serial write error: {e}")
+            self._log(f"Serial write error: {e}")
+            return False
     
-    def send_test(self, pattern='all_off'):
-        """Send test pattern - updates internal DMX data for output worker to send"""
-        data = [0] * config.DMX_CHANNELS
+    def _write_fd(self, payload):
+        """Write header + payload to the fd with a single os.writev() call
         
-        if pattern == 'all_on':
-            data = [255] * config.DMX_CHANNELS
-        elif pattern == 'first_5':
-            data[:5] = [255] * 5
-        elif pattern == 'dim':
-            data = [128] * config.DMX_CHANNELS
-        
-        # Update internal DMX data
-        self.dmx_data = data
+        The kernel gathers both buffers, so the payload is never copied into a
+        packet in userspace, and the GIL is released around the syscall.
+        pyserial opens the port with O_NONBLOCK, so a write can be partial when
+        the OS transmit buffer is full. The unsent tail is finished on the next
+        call before any new frame, keeping frames intact on the wire. Returns
+        False if the frame was skipped because the link is busy.
+        """
+        if self._tx_pending and not self._flush_pending():
+            return False  # Link still busy; skip this frame
         
-        # Add to processing queue so output worker sends it
         try:
-            # Clear the queue first to make test pattern immediate
-            while not self.frame_queue.empty():
-                try:
-                    self.frame_queue.get_nowait()
-                except queue.Empty:
-                    break
-            
-            # Add test pattern multiple times to ensure it's sent
-            for _ in range(5):
-                try:
-                    self.frame_queue.put_nowait(data)
-                except queue.Full:
-                    break
-        except Exception as e:
-            print(f"Queue error: {e}")
+            n = os.writev(self._fd, (self._header, payload))
+        except BlockingIOError:
+            return False  # Nothing written; skip this frame
+        if n < self._frame_size:
+            self._tx_pending = (self._header + payload)[n:]
+        return True
+    
+    def _flush_pending(self):
+        """Write the unsent tail of the last frame, returns True once it is all out"""
+        try:
+            n = os.write(self._fd, self._tx_pending)
+        except BlockingIOError:
+            n = 0
+        self._tx_pending = self._tx_pending[n:]
+        return not self._tx_pending
+    
+    def send_test(self, pattern='all_off'):
+        """Send test pattern - updates internal DMX data for output worker to send"""
+        # Patterns are prebuilt; unknown names fall back to all off
+        data = self._test_patterns.get(pattern, self._zero_frame)
+        
+        # Update internal DMX data and publish it for the output worker
+        self.dmx_data[:] = data
+        self._latest_frame = data
+        self._update_event.set()
         
         print(f"✓ Test pattern: {pattern} (queued for output)")
     
+    def wait_for_update(self, timeout=None):
+        """Block until DMX activity changes or a test pattern is sent
+        
+        Returns True if woken by an update, False if the timeout expired.
+        """
+        woken = self._update_event.wait(timeout)
+        self._update_event.clear()
+        return woken
+    
     def get_fps(self):
-        """Get current FPS with performance stats"""
+        """Get current FPS"""
         current_time = time.perf_counter()
         elapsed = current_time - self.fps_start_time
         
@@ -322,25 +606,56 @@ class DMXBridge:
             self.fps = self.fps_counter / elapsed
             self.fps_counter = 0
             self.fps_start_time = current_time
-            
-            # Print performance stats only if monitoring is enabled
-            if config.PERFORMANCE_MONITORING and (self.dropped_frames > 0 or self.processed_frames > 0):
-                drop_rate = (self.dropped_frames / (self.dropped_frames + self.processed_frames)) * 100
-                if drop_rate > 5.0:  # Only warn if drop rate is significant
-                    print(f"\nPerformance: {self.fps:.1f} FPS, {drop_rate:.1f}% dropped frames")
         
         return int(self.fps)
     
-    def get_performance_stats(self):
-        """Get detailed performance statistics"""
+    def get_channel_stats(self):
+        """Get (active channel count, max value) of the current DMX data
+        
+        Cached per frame, so polling it while the data is unchanged costs a
+        single compare instead of a scan over all channels.
+        """
+        data = self.dmx_data
+        if data != self._stats_frame:
+            frame = bytes(data)
+            active = len(frame) - frame.count(0)
+            self._channel_stats = (active, max(frame) if active else 0)
+            self._stats_frame = frame
+        return self._channel_stats
+    
+    def _drop_rate(self):
+        """Compute the drop rate (%) and warn once when it becomes significant
+        
+        Derived stats are computed here, off the per-frame paths, which
+        only ever increment counters.
+        """
         total_frames = self.processed_frames + self.dropped_frames
         drop_rate = (self.dropped_frames / total_frames * 100) if total_frames > 0 else 0
         
+        # Warn once when the drop rate becomes significant, if monitoring is enabled
+        high_drop = drop_rate > 5.0
+        if self._perf_mon and high_drop and not self._drop_warned:
+            print(f"\nPerformance: {self.fps:.1f} FPS, {drop_rate:.1f}% dropped frames")
+        self._drop_warned = high_drop
+        return drop_rate
+    
+    def get_snapshot(self):
+        """Get FPS, channel stats and frame counters in one call, for status displays"""
+        active, max_val = self.get_channel_stats()
+        return Snapshot(self.get_fps(), active, max_val,
+                        self.processed_frames, self.dropped_frames, self._drop_rate())
+    
+    def get_performance_stats(self):
+        """Get detailed performance statistics"""
+        drop_rate = self._drop_rate()
+        
         return {
             'fps': self.fps,
             'processed_frames': self.processed_frames,
             'dropped_frames': self.dropped_frames,
+            'frames_written': self.frames_written,
             'drop_rate': drop_rate,
+            'tx_overrun': self.tx_overrun,
             'active': self.active
         }
     
@@ -348,10 +663,18 @@ class DMXBridge:
         """Stop everything gracefully"""
         print("\nShutting down...")
         self.running = False
+        self._update_event.set()  # Release any wait_for_update() callers
 
         # Wait for threads to finish
         if self.output_thread and self.output_thread.is_alive():
             self.output_thread.join(timeout=1.0)
+        if self._log_thread and self._log_thread.is_alive():
+            self._log_thread.join(timeout=1.0)
+
+        # Restore default Windows timer resolution
+        if self._timer_period_set:
+            ctypes.WinDLL('winmm').timeEndPeriod(1)
+            self._timer_period_set = False
 
         # Stop sACN receiver
         if self.receiver:
@@ -364,10 +687,18 @@ class DMXBridge:
             except:
                 pass
 
+        # Stop receiver process and release shared memory
+        self._stop_receiver_process()
+
         # Close serial connection
+        self._connected = False
+        self._fd = None
         if self.ser and self.ser.is_open:
             self.ser.close()
 
+        # Print anything the receiver/output threads logged last
+        self._flush_log()
+
         # Print final stats
         stats = self.get_performance_stats()
         print(f"Final stats: {stats['fps']:.1f} FPS, {stats['drop_rate']:.1f}% dropped")
@@ -122,57 +122,6 @@ def test_serial_write_speed():
         print("  ✗ pyserial not installed")
         return None
 
-def test_queue_performance():
-    """Test queue performance"""
-    print("\nTesting queue performance...")
-    
-    import queue
-    import threading
-    
-    test_queue = queue.Queue(maxsize=config.FRAME_BUFFER_SIZE)
-    
-    # Producer thread
-    def producer():
-        for i in range(1000):
-            try:
-                test_queue.put_nowait([128] * config.DMX_CHANNELS)
-            except queue.Full:
-                pass
-    
-    # Consumer thread
-    consumed = [0]
-    def consumer():
-        while consumed[0] < 1000:
-            try:
-                test_queue.get_nowait()
-                consumed[0] += 1
-            except queue.Empty:
-                time.sleep(0.0001)
-    
-    start = time.perf_counter()
-    
-    prod_thread = threading.Thread(target=producer)
-    cons_thread = threading.Thread(target=consumer)
-    
-    prod_thread.start()
-    cons_thread.start()
-    
-    prod_thread.join()
-    cons_thread.join()
-    
-    elapsed = time.perf_counter() - start
-    ops_per_sec = 1000 / elapsed
-    
-    print(f"  Processed 1000 frames in {elapsed:.3f}s")
-    print(f"  Queue throughput: {ops_per_sec:.1f} ops/s")
-    
-    if ops_per_sec < config.OUTPUT_FPS * 2:
-        print(f"  WARNING: Queue performance is marginal")
-    else:
-        print(f"  ✓ Queue performance is good")
-    
-    return ops_per_sec >= config.OUTPUT_FPS * 2
-
 def test_cpu_usage():
     """Check system CPU availability"""
     print("\nChecking system resources...")
@@ -208,14 +157,12 @@ def main():
     print(f"\nConfiguration:")
     print(f"  Output FPS: {config.OUTPUT_FPS}")
     print(f"  DMX Channels: {config.DMX_CHANNELS}")
-    print(f"  Buffer Size: {config.FRAME_BUFFER_SIZE}")
     print(f"  Baud Rate: {config.ARDUINO_BAUD}")
     
     results = []
     
     results.append(("Timing Precision", test_timing_precision()))
     results.append(("Frame Generation", test_frame_generation_speed()))
-    results.append(("Queue Performance", test_queue_performance()))
     results.append(("Serial Write Speed", test_serial_write_speed()))
     results.append(("System Resources", test_cpu_usage()))
     
@@ -246,7 +193,6 @@ def main():
         if any(name == "Timing Precision" and not result for name, result in results):
             print("  - Close background applications")
             print("  - Consider using a real-time OS")
-        print("  - Increase FRAME_BUFFER_SIZE in config.py")
     else:
         print("\n✓ System performance looks good!")
         print("  The DMX bridge should run efficiently")
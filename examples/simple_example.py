@@ -6,6 +6,9 @@ This example shows how to use the DMX Bridge as a library in your own projects.
 """
 
 from dmx_bridge import DMXBridge
+import os
+import signal
+import threading
 import time
 import math
 
@@ -38,8 +41,9 @@ def main():
         
         # Example 2: Fade effect
         print("Example 2: Smooth fade on channel 1")
-        for i in range(100):
-            brightness = int(128 + 127 * math.sin(i / 10))
+        # Precompute the fade curve once, then just index into it
+        fade_table = [int(128 + 127 * math.sin(i / 10)) for i in range(100)]
+        for brightness in fade_table:
             bridge.dmx_data[0] = brightness
             time.sleep(0.05)
         
@@ -47,7 +51,7 @@ def main():
         print("\nExample 3: Monitoring status for 10 seconds")
         for _ in range(10):
             stats = bridge.get_performance_stats()
-            active = sum(1 for v in bridge.dmx_data if v > 0)
+            active, _ = bridge.get_channel_stats()
             print(f"FPS: {bridge.get_fps()} | Active: {active}/512 | Drop: {stats['drop_rate']:.1f}%")
             time.sleep(1)
         
@@ -59,9 +63,14 @@ def main():
         print("\nDone! The bridge will continue running...")
         print("Press Ctrl+C to stop")
         
-        # Keep running
-        while True:
-            time.sleep(1)
+        # Keep running: block until Ctrl+C instead of waking up every second
+        stop = threading.Event()
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
+        # Windows can't interrupt an untimed wait, so it checks once a second
+        timeout = None if os.name == 'posix' else 1.0
+        while not stop.wait(timeout):
+            pass
+        print("\n\nShutting down...")
             
     except KeyboardInterrupt:
         print("\n\nShutting down...")
@@ -4,44 +4,82 @@ DMX Bridge - Command Line Interface
 Simple CLI for controlling the DMX bridge with real-time status monitoring.
 """
 
+import os
+import selectors
 import sys
 import time
-import threading
 from dmx_bridge import DMXBridge
 import config
 
+# Fixed output blocks, built once at import
+_SEP = "=" * 60
+_SEP_DASH = "-" * 60
+_BANNER = "\n" + _SEP + "\n  %s to DMX Bridge - Command Line Interface\n" + _SEP + "\n"
+_COMMANDS_HELP = "\n".join([
+    "",
+    _SEP_DASH,
+    "Commands:",
+    "  1  - Test: All OFF",
+    "  2  - Test: First 5 channels @ 255",
+    "  3  - Test: All @ 50% (128)",
+    "  4  - Test: All ON (255)",
+    "  s  - Show current status",
+    "  c  - Show configuration",
+    "  q  - Quit",
+    _SEP_DASH,
+    "\n",
+])
+
 
 class DMXBridgeCLI:
     def __init__(self):
         self.bridge = DMXBridge()
         self.running = False
         self.status_thread = None
+        # PROTOCOL is fixed at startup; resolve the display name and branch flags once
+        self._proto_upper = config.PROTOCOL.upper()
+        self._is_sacn = config.PROTOCOL.lower() == "sacn"
+        self._is_artnet = config.PROTOCOL.lower() == "artnet"
+        # Command key -> handler ('q' is handled by the command loop)
+        self._dispatch = {
+            '1': lambda: self.bridge.send_test('all_off'),
+            '2': lambda: self.bridge.send_test('first_5'),
+            '3': lambda: self.bridge.send_test('dim'),
+            '4': lambda: self.bridge.send_test('all_on'),
+            's': self.show_status,
+            'c': self.print_config,
+            '?': self.print_commands,
+        }
+        self._last_status = (0, 0, 0, 0)  # fps, active, max, dropped last printed
+        self._last_snap = None  # Latest bridge snapshot, shared by status line and 's'
+        self._last_snap_time = 0.0
+        # Status line template with the channel count baked in once
+        self._status_fmt = "\rFPS: {:2d} | Active: {:3d}/%d | Max: {:3d} | Drop: {:.1f}%%" % config.DMX_CHANNELS
         
     def print_banner(self):
         """Print startup banner"""
-        protocol_name = config.PROTOCOL.upper()
-        print("\n" + "="*60)
-        print(f"  {protocol_name} to DMX Bridge - Command Line Interface")
-        print("="*60)
+        sys.stdout.write(_BANNER % self._proto_upper)
         
     def print_config(self):
         """Display current configuration"""
-        print("\nConfiguration:")
-        print(f"  Protocol:        {config.PROTOCOL.upper()}")
-        print(f"  Arduino Port:    {config.ARDUINO_PORT} @ {config.ARDUINO_BAUD} baud")
-
-        if config.PROTOCOL.lower() == "sacn":
-            print(f"  sACN Universe:   {config.SACN_UNIVERSE}")
-        elif config.PROTOCOL.lower() == "artnet":
-            print(f"  ArtNet Universe: {config.ARTNET_UNIVERSE}")
-            print(f"  ArtNet IP:       {config.ARTNET_IP}")
-
-        print(f"  DMX Channels:    {config.DMX_CHANNELS}")
-        print(f"  DMX Rate:        {config.DMX_FPS} FPS")
-        print(f"  Output Rate:     {config.OUTPUT_FPS} FPS (2x DMX)")
-        print(f"  Buffer Size:     {config.FRAME_BUFFER_SIZE} frames")
-        print(f"  Performance:     {'Enabled' if config.PERFORMANCE_MONITORING else 'Disabled'}")
-        print()
+        # Collect the block and write it at once: one write on slow consoles
+        lines = ["", "Configuration:"]
+        lines.append(f"  Protocol:        {self._proto_upper}")
+        lines.append(f"  Arduino Port:    {config.ARDUINO_PORT} @ {config.ARDUINO_BAUD} baud")
+
+        if self._is_sacn:
+            lines.append(f"  sACN Universe:   {config.SACN_UNIVERSE}")
+        elif self._is_artnet:
+            lines.append(f"  ArtNet Universe: {config.ARTNET_UNIVERSE}")
+            lines.append(f"  ArtNet IP:       {config.ARTNET_IP}")
+
+        lines.append(f"  DMX Channels:    {config.DMX_CHANNELS}")
+        lines.append(f"  DMX Rate:        {config.DMX_FPS} FPS")
+        lines.append(f"  Output Rate:     {config.OUTPUT_FPS} FPS (2x DMX)")
+        lines.append(f"  Performance:     {'Enabled' if config.PERFORMANCE_MONITORING else 'Disabled'}")
+        lines.append("\n")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
         
     def start(self):
         """Start the bridge"""
@@ -58,92 +96,153 @@ class DMXBridgeCLI:
             
         # Start protocol receiver
         if not self.bridge.start_protocol():
-            print(f"\n✗ Failed to start {config.PROTOCOL.upper()} receiver")
+            print(f"\n✗ Failed to start {self._proto_upper} receiver")
             return False
             
         print("\n✓ Bridge started successfully")
         self.running = True
         
-        # Start status thread
-        self.status_thread = threading.Thread(target=self.status_loop, daemon=True)
-        self.status_thread.start()
-        
         return True
     
+    def _refresh_snapshot(self):
+        """Take a new bridge snapshot and cache it with its timestamp"""
+        self._last_snap = self.bridge.get_snapshot()
+        self._last_snap_time = time.monotonic()
+        return self._last_snap
+    
+    def update_status(self):
+        """Refresh the status line if anything changed since it was last printed"""
+        fps, active, max_val, _, dropped, drop_rate = self._refresh_snapshot()
+        
+        # Only print if changed; integer counters, so one tuple compare
+        status = (fps, active, max_val, dropped)
+        if status != self._last_status:
+            sys.stdout.write(self._status_fmt.format(fps, active, max_val, drop_rate))
+            sys.stdout.flush()
+            self._last_status = status
+    
     def status_loop(self):
-        """Background status display with performance monitoring"""
-        last_fps = 0
-        last_active = 0
-        last_max = 0
-        last_drop_rate = 0
+        """Background status display, used when stdin can't be polled"""
+        update_status = self.update_status
+        wait_for_update = self.bridge.wait_for_update
         
         while self.running:
-            time.sleep(1)
-            
-            # Get stats
-            fps = self.bridge.get_fps()
-            data = self.bridge.dmx_data
-            active = sum(1 for v in data if v > 0)
-            max_val = max(data) if data else 0
-            
-            # Get performance stats
-            stats = self.bridge.get_performance_stats()
-            drop_rate = stats['drop_rate']
-            
-            # Only print if changed
-            if (fps != last_fps or active != last_active or max_val != last_max or 
-                abs(drop_rate - last_drop_rate) > 0.1):
-                status = (f"FPS: {fps:2d} | Active: {active:3d}/{config.DMX_CHANNELS} | "
-                         f"Max: {max_val:3d} | Drop: {drop_rate:.1f}%")
-                print(f"\r{status}", end='', flush=True)
-                last_fps = fps
-                last_active = active
-                last_max = max_val
-                last_drop_rate = drop_rate
+            # Wake early on activity changes, otherwise refresh once a second
+            wait_for_update(1.0)
+            if not self.running:
+                break  # Woken by shutdown; don't print into its output
+            update_status()
     
     def print_commands(self):
         """Print available commands"""
-        print("\n" + "-"*60)
-        print("Commands:")
-        print("  1  - Test: All OFF")
-        print("  2  - Test: First 5 channels @ 255")
-        print("  3  - Test: All @ 50% (128)")
-        print("  4  - Test: All ON (255)")
-        print("  s  - Show current status")
-        print("  c  - Show configuration")
-        print("  q  - Quit")
-        print("-"*60)
-        print()
+        sys.stdout.write(_COMMANDS_HELP)
+        sys.stdout.flush()
     
     def show_status(self):
         """Show detailed status with performance metrics"""
-        print("\n" + "="*60)
-        print("Current Status:")
-        print(f"  Arduino:    {'Connected' if self.bridge.ser and self.bridge.ser.is_open else 'Disconnected'}")
-
-        protocol_name = config.PROTOCOL.upper()
-        if config.PROTOCOL.lower() == "sacn":
-            receiver_status = 'Listening' if self.bridge.receiver else 'Stopped'
-            print(f"  sACN:       {receiver_status}")
-        elif config.PROTOCOL.lower() == "artnet":
-            receiver_status = 'Listening' if self.bridge.artnet_server else 'Stopped'
-            print(f"  ArtNet:     {receiver_status}")
-
-        print(f"  DMX Active: {'Yes' if self.bridge.active else 'No'}")
-        print(f"  FPS:        {self.bridge.get_fps()}")
-
-        data = self.bridge.dmx_data
-        active = sum(1 for v in data if v > 0)
-        max_val = max(data) if data else 0
-        print(f"  Active Ch:  {active}/{config.DMX_CHANNELS}")
-        print(f"  Max Value:  {max_val}")
+        # Reuse the status line's snapshot if it is recent enough
+        age = time.monotonic() - self._last_snap_time
+        if self._last_snap is None or age >= 0.5:
+            snap, age = self._refresh_snapshot(), 0.0
+        else:
+            snap = self._last_snap
+
+        lines = ["", _SEP, f"Current Status: (age: {age * 1000:.0f}ms)"]
+        lines.append(f"  Arduino:    {'Connected' if self.bridge.is_connected() else 'Disconnected'}")
+
+        proc = self.bridge.receiver_process
+        proc_alive = proc is not None and proc.is_alive()
+        if self._is_sacn:
+            receiver_status = 'Listening' if self.bridge.receiver or proc_alive else 'Stopped'
+            lines.append(f"  sACN:       {receiver_status}")
+        elif self._is_artnet:
+            receiver_status = 'Listening' if self.bridge.artnet_server or proc_alive else 'Stopped'
+            lines.append(f"  ArtNet:     {receiver_status}")
+
+        lines.append(f"  DMX Active: {'Yes' if self.bridge.active else 'No'}")
+        lines.append(f"  FPS:        {snap.fps}")
+        lines.append(f"  Active Ch:  {snap.active}/{config.DMX_CHANNELS}")
+        lines.append(f"  Max Value:  {snap.max_val}")
 
         # Performance stats
-        stats = self.bridge.get_performance_stats()
-        print(f"  Processed:  {stats['processed_frames']}")
-        print(f"  Dropped:    {stats['dropped_frames']}")
-        print(f"  Drop Rate:  {stats['drop_rate']:.1f}%")
-        print("="*60 + "\n")
+        lines.append(f"  Processed:  {snap.processed}")
+        lines.append(f"  Written:    {self.bridge.frames_written}")
+        lines.append(f"  Dropped:    {snap.dropped}")
+        lines.append(f"  Drop Rate:  {snap.drop_rate:.1f}%")
+        lines.append(_SEP + "\n\n")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
+    
+    def handle_command(self, cmd):
+        """Run one command, returns False when the CLI should quit"""
+        handler = self._dispatch.get(cmd)
+        if handler:
+            handler()
+        elif cmd == 'q':
+            return False
+        elif cmd:
+            print(f"Unknown command: {cmd}")
+        return True
+    
+    def _select_loop(self):
+        """Single-threaded command loop: wait on stdin, refresh status in between
+        
+        Returns False if stdin can't be polled (Windows, regular files), in
+        which case nothing has been read yet.
+        """
+        if os.name != 'posix':
+            return False
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(sys.stdin, selectors.EVENT_READ)
+        except (ValueError, OSError):
+            sel.close()
+            return False
+        
+        fd = sys.stdin.fileno()
+        pending = b''
+        next_status = time.monotonic() + 1.0
+        try:
+            while self.running:
+                if sel.select(max(0.0, next_status - time.monotonic())):
+                    chunk = os.read(fd, 4096)
+                    if not chunk:
+                        # EOF: run a last line that had no trailing newline
+                        if pending:
+                            self.handle_command(pending.decode(errors='replace').strip().lower())
+                        break
+                    # A read may hold several lines (pipes) or a partial one
+                    *lines, pending = (pending + chunk).split(b'\n')
+                    for line in lines:
+                        if not self.handle_command(line.decode(errors='replace').strip().lower()):
+                            return True
+                    if lines:
+                        self.update_status()  # Show the effect of a command right away
+                
+                now = time.monotonic()
+                if now >= next_status:
+                    self.update_status()
+                    next_status += 1.0
+                    if next_status < now:
+                        next_status = now + 1.0
+        finally:
+            sel.close()
+        return True
+    
+    def _input_loop(self):
+        """Blocking input() loop with the status display on its own thread"""
+        import threading  # Only this fallback path needs a thread
+        
+        self.status_thread = threading.Thread(target=self.status_loop, daemon=True)
+        self.status_thread.start()
+        
+        while self.running:
+            try:
+                cmd = input().strip().lower()
+            except EOFError:
+                break
+            if not self.handle_command(cmd):
+                break
     
     def run(self):
         """Main command loop"""
@@ -155,32 +254,8 @@ class DMXBridgeCLI:
         print("Ready for commands (type command or 'q' to quit)...\n")
         
         try:
-            while self.running:
-                try:
-                    cmd = input().strip().lower()
-                    
-                    if cmd == 'q':
-                        break
-                    elif cmd == '1':
-                        self.bridge.send_test('all_off')
-                    elif cmd == '2':
-                        self.bridge.send_test('first_5')
-                    elif cmd == '3':
-                        self.bridge.send_test('dim')
-                    elif cmd == '4':
-                        self.bridge.send_test('all_on')
-                    elif cmd == 's':
-                        self.show_status()
-                    elif cmd == 'c':
-                        self.print_config()
-                    elif cmd == '?':
-                        self.print_commands()
-                    elif cmd:
-                        print(f"Unknown command: {cmd}")
-                        
-                except EOFError:
-                    break
-                    
+            if not self._select_loop():
+                self._input_loop()
         except KeyboardInterrupt:
             pass
         